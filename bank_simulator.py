@@ -1,39 +1,122 @@
-import getpass
+import hashlib
+import hmac
 import os
+import re
+import sys
+from collections import deque
+from decimal import ROUND_HALF_EVEN, Context, Decimal
+from functools import partial
 
-def getFloat(prompt):
+# Every screen ends in a prompt, and _prompt/clearScreen flush stdout, so
+# there is no need to flush on each newline.
+sys.stdout.reconfigure(line_buffering=False)
+
+_MENU = ("--- Account Menu ---\n"
+         "1. Deposit\n"
+         "2. Withdraw\n"
+         "3. PIX Transfer\n"
+         "4. Show Account Info\n"
+         "5. View Transactions\n"
+         "6. Set/Update PIX Key\n"
+         "7. Change Credit Limit\n"
+         "8. Change Password\n"
+         "9. Logout")
+
+_MAIN_MENU = ("=== Simple Bank App ===\n"
+              "1. Register\n"
+              "2. Login\n"
+              "3. Exit")
+
+def _prompt(prompt, _write=sys.stdout.write, _flush=sys.stdout.flush,
+            _readline=sys.stdin.readline):
+    _write(prompt)
+    _flush()
+    line = _readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+def _getpass(prompt):
+    # getpass drags in termios/msvcrt; only pay for it once a password is asked for
+    from getpass import getpass
+    return getpass(prompt)
+
+_MAX_AMOUNT = Decimal("999999999999999.99")
+_CENT = Decimal("0.01")
+_MONEY_CTX = Context(prec=20, rounding=ROUND_HALF_EVEN)
+
+_AMOUNT_RE = re.compile(r"[+-]?(?:\d{1,15}(?:\.\d{0,2})?|\.\d{1,2})")
+
+def getAmount(prompt, _match=_AMOUNT_RE.fullmatch):
+    # amounts are kept as integer cents
     while 1:
-        try:
-            return float(input(prompt))
-        except ValueError:
-            print("Invalid number.")
+        s = _prompt(prompt).strip()
+        if _match(s):
+            amount = Decimal(s)
+            if abs(amount) <= _MAX_AMOUNT:
+                return int(amount.quantize(_CENT, context=_MONEY_CTX).scaleb(2, _MONEY_CTX))
+        print("Invalid number.")
+
+if os.name == 'nt':
+    os.system('')    # enables ANSI escape processing on the Windows console
+
+_CLEAR = "\x1b[2J\x1b[H"
 
-def clearScreen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+def clearScreen(_write=sys.stdout.write, _flush=sys.stdout.flush):
+    _write(_CLEAR)
+    _flush()
 
 def pause():
-    input("\nPress Enter to continue...")
+    _prompt("\nPress Enter to continue...")
+
+def _hash_password(password):
+    return hashlib.sha256(password.encode()).digest()
+
+def _fmt_cents(cents):
+    q, r = divmod(abs(cents), 100)
+    return f"{'-' if cents < 0 else ''}{q}.{r:02d}"
+
+_TX_FORMATS = {
+    "D": lambda amount, balance: f"Deposited {_fmt_cents(amount)}. Balance: {_fmt_cents(balance)}",
+    "W": lambda amount, balance: f"Withdrew {_fmt_cents(amount)}. Balance: {_fmt_cents(balance)}",
+    "C": lambda amount: f"Added {_fmt_cents(amount)} to balance using credit.",
+    "T": lambda amount, name, balance: f"Transferred {_fmt_cents(amount)} to {name} (PIX). Balance: {_fmt_cents(balance)}",
+    "R": lambda amount, name, balance: f"Received {_fmt_cents(amount)} from {name} (PIX). Balance: {_fmt_cents(balance)}",
+    "L": lambda limit: f"Changed credit limit to {_fmt_cents(limit)}",
+    "P": lambda: "Password changed.",
+    "K": lambda: "PIX key set/updated.",
+}
+
+def _format_tx(record):
+    return _TX_FORMATS[record[0]](*record[1:])
 
 class BankAccount:
+    __slots__ = ('username', 'password', 'agency', 'balance', 'credit_limit',
+                 'credit_used', 'available_credit', 'transactions', 'pix_key')
+
     def __init__(self, username, password, agency):
         self.username = username
-        self.password = password
+        self.password = _hash_password(password)
         self.agency = agency
-        self.balance = 0.0
-        self.credit_limit = 100.0
-        self.credit_used = 0.0
-        self.transactions = []
+        self.balance = 0
+        self.credit_limit = 10000
+        self.credit_used = 0
+        self.available_credit = self.credit_limit
+        self.transactions = deque()
         self.pix_key = None
 
-    def logTransaction(self, description):
-        self.transactions.append(description)
+    def logTransaction(self, record):
+        self.transactions.append(record)
+
+    def checkPassword(self, password):
+        return hmac.compare_digest(self.password, _hash_password(password))
 
     def deposit(self, amount):
         if amount > 0:
             self.balance += amount
-            self.logTransaction(f"Deposited {amount}. Balance: {self.balance}")
+            self.logTransaction(("D", amount, self.balance))
             clearScreen()
-            print(f"Deposited {amount}. New balance: {self.balance}")
+            print(f"Deposited {_fmt_cents(amount)}. New balance: {_fmt_cents(self.balance)}")
         else:
             clearScreen()
             print("Invalid deposit amount.")
@@ -45,14 +128,30 @@ class BankAccount:
             return
         if amount <= self.balance:
             self.balance -= amount
-            self.logTransaction(f"Withdrew {amount}. Balance: {self.balance}")
+            self.logTransaction(("W", amount, self.balance))
             clearScreen()
-            print(f"Withdrew {amount}. New balance: {self.balance}")
+            print(f"Withdrew {_fmt_cents(amount)}. New balance: {_fmt_cents(self.balance)}")
         else:
             clearScreen()
             print("Insufficient funds.")
 
-    def transfer(self, amount, pix_key):
+    def takeCredit(self, amount):
+        if amount <= 0:
+            clearScreen()
+            print("Invalid transfer amount.")
+            return
+        if amount <= self.available_credit:
+            self.credit_used += amount
+            self.available_credit -= amount
+            self.balance += amount
+            self.logTransaction(("C", amount))
+            clearScreen()
+            print(f"Added {_fmt_cents(amount)} to balance using credit.")
+        else:
+            clearScreen()
+            print("Not enough credit available.")
+
+    def transfer(self, amount, pix_key):    # pix_key belongs to another account
         if not self.pix_key:
             clearScreen()
             print("You must set your own PIX key before making transfers.")
@@ -61,49 +160,39 @@ class BankAccount:
             clearScreen()
             print("Invalid transfer amount.")
             return
-        if pix_key == self.pix_key:
-            if amount <= self.credit_limit - self.credit_used:
-                self.credit_used += amount
-                self.balance += amount
-                self.logTransaction(f"Added {amount} to balance using credit.")
-                clearScreen()
-                print(f"Added {amount} to balance using credit.")
-            else:
-                clearScreen()
-                print("Not enough credit available.")
+        target_account = by_key.get(("p", pix_key))
+        if not target_account:
+            clearScreen()
+            print("Target PIX key not found.")
+            return
+        if not target_account.pix_key:
+            clearScreen()
+            print("Target account has not set a PIX key.")
+            return
+        if amount <= self.balance:
+            self.balance -= amount
+            target_account.balance += amount
+            self.transactions.append(("T", amount, target_account.username, self.balance))
+            target_account.transactions.append(("R", amount, self.username, target_account.balance))
+            clearScreen()
+            print(f"Transferred {_fmt_cents(amount)} to {target_account.username}.")
         else:
-            target_account = pix_registry.get(pix_key)
-            if not target_account:
-                clearScreen()
-                print("Target PIX key not found.")
-                return
-            if not target_account.pix_key:
-                clearScreen()
-                print("Target account has not set a PIX key.")
-                return
-            if amount <= self.balance:
-                self.balance -= amount
-                target_account.balance += amount
-                self.logTransaction(f"Transferred {amount} to {target_account.username} (PIX). Balance: {self.balance}")
-                target_account.logTransaction(f"Received {amount} from {self.username} (PIX). Balance: {target_account.balance}")
-                clearScreen()
-                print(f"Transferred {amount} to {target_account.username}.")
-            else:
-                clearScreen()
-                print("Insufficient funds for transfer.")
+            clearScreen()
+            print("Insufficient funds for transfer.")
 
     def changeCreditLimit(self, new_limit):
         if new_limit >= self.credit_used:    # cannot set lower than already used
+            self.available_credit += new_limit - self.credit_limit
             self.credit_limit = new_limit
-            self.logTransaction(f"Changed credit limit to {new_limit}")
+            self.logTransaction(("L", new_limit))
             clearScreen()
-            print(f"Credit limit updated to {new_limit}")
+            print(f"Credit limit updated to {_fmt_cents(new_limit)}")
         else:
             clearScreen()
             print("New limit cannot be lower than current credit used.")
 
     def changePass(self, old_password, new_password):
-        if self.password != old_password:
+        if not self.checkPassword(old_password):
             clearScreen()
             print("Incorrect current password.")
             return False
@@ -111,159 +200,163 @@ class BankAccount:
             clearScreen()
             print("New password cannot be empty.")
             return False
-        self.password = new_password
-        self.logTransaction("Password changed.")
+        self.password = _hash_password(new_password)
+        self.logTransaction(("P",))
         clearScreen()
         print("Password updated successfully.")
         return True
 
-accounts = {}
-pix_registry = {}
+# usernames are keyed as ("u", name), PIX keys as ("p", key)
+by_key = {}
 
 default_user1 = BankAccount("user1", "pass", "DF")
 default_user1.pix_key = "user1pix"
-accounts["user1"] = default_user1
-pix_registry["user1pix"] = default_user1
+by_key["u", "user1"] = default_user1
+by_key["p", "user1pix"] = default_user1
 
 default_user2 = BankAccount("user2", "pass", "DF")
 default_user2.pix_key = "user2pix"
-accounts["user2"] = default_user2
-pix_registry["user2pix"] = default_user2
+by_key["u", "user2"] = default_user2
+by_key["p", "user2pix"] = default_user2
 
-def signUp():
-    clearScreen()
-    username = input("Choose username: ")
-    if username in accounts:
-        clearScreen()
-        print("Username already taken.")
+def signUp(_inp=_prompt, _pr=print, _clear=clearScreen, _pause=pause,
+           _getpass=_getpass):
+    _clear()
+    username = sys.intern(_inp("Choose username: "))
+    if ("u", username) in by_key:
+        _clear()
+        _pr("Username already taken.")
         return
-    password = getpass.getpass("Enter password: ")
-    agency = input("Enter agency: ")
+    password = _getpass("Enter password: ")
+    agency = _inp("Enter agency: ")
     if not agency.strip():
-        clearScreen()
-        print("Agency is required.")
-        pause()
+        _clear()
+        _pr("Agency is required.")
+        _pause()
         return
-    accounts[username] = BankAccount(username, password, agency)
-    clearScreen()
-    print("Account registered successfully!")
-
-def logIn():
-    clearScreen()
-    username = input("Enter username: ")
-    password = getpass.getpass("Enter password: ")
-    account = accounts.get(username)
-    if account and account.password == password:
-        clearScreen()
-        print(f"Welcome, {username}!")
-        pause()
+    by_key["u", username] = BankAccount(username, password, agency)
+    _clear()
+    _pr("Account registered successfully!")
+
+def logIn(_inp=_prompt, _pr=print, _clear=clearScreen, _pause=pause,
+          _getpass=_getpass, _get=by_key.get):
+    _clear()
+    username = sys.intern(_inp("Enter username: "))
+    password = _getpass("Enter password: ")
+    account = _get(("u", username))
+    if account and account.checkPassword(password):
+        _clear()
+        _pr(f"Welcome, {username}!")
+        _pause()
         accountMenu(account)
     else:
+        _clear()
+        _pr("Invalid credentials.")
+
+def _do_deposit(account):
+    amount = getAmount("Deposit amount: ")
+    account.deposit(amount)
+
+def _do_withdraw(account):
+    amount = getAmount("Withdraw amount: ")
+    account.withdraw(amount)
+
+def _do_transfer(account):
+    pix_key = sys.intern(_prompt("Target PIX key: ").strip())
+    amount = getAmount("Transfer amount: ")
+    if pix_key == account.pix_key:
+        account.takeCredit(amount)
+    else:
+        account.transfer(amount, pix_key)
+
+def _do_show_info(account):
+    print(f"Username: {account.username}")
+    print(f"Agency: {account.agency}")
+    print(f"Balance: {_fmt_cents(account.balance)}")
+    print(f"Credit Used: {_fmt_cents(account.credit_used)}/{_fmt_cents(account.credit_limit)}")
+    print(f"PIX Key: {account.pix_key or 'Not set'}")
+
+def _do_view_transactions(account):
+    sys.stdout.write("\n".join(("--- Transaction Log ---", *map(_format_tx, account.transactions))) + "\n")
+
+def _do_set_pix_key(account):
+    pix_key = sys.intern(_prompt("Enter new PIX key: ").strip())
+    if not pix_key:
+        clearScreen()
+        print("PIX key cannot be empty.")
+    elif by_key.get(("p", pix_key), account) != account:
         clearScreen()
-        print("Invalid credentials.")
+        print("This PIX key is already registered to another account.")
+    else:
+        if account.pix_key:
+            by_key.pop(("p", account.pix_key), None)
+        account.pix_key = pix_key
+        by_key["p", pix_key] = account
+        account.logTransaction(("K",))
+        clearScreen()
+        print("PIX key updated successfully.")
+
+def _do_change_credit_limit(account):
+    new_limit = getAmount("New credit limit: ")
+    account.changeCreditLimit(new_limit)
+
+def _do_change_password(account):
+    old_pass = _getpass("Enter current password: ")
+    new_pass = _getpass("Enter new password: ")
+    account.changePass(old_pass, new_pass)
 
-def accountMenu(account):
+_HANDLERS = {
+    "1": _do_deposit,
+    "2": _do_withdraw,
+    "3": _do_transfer,
+    "4": _do_show_info,
+    "5": _do_view_transactions,
+    "6": _do_set_pix_key,
+    "7": _do_change_credit_limit,
+    "8": _do_change_password,
+}
+
+def accountMenu(account, _inp=_prompt, _pr=print, _clear=clearScreen, _pause=pause,
+                _handlers=_HANDLERS):
+    # bind this session's account into every handler once, up front
+    _get = {choice: partial(handler, account) for choice, handler in _handlers.items()}.get
     while 1:
-        clearScreen()
-        print("--- Account Menu ---")
-        print("1. Deposit")
-        print("2. Withdraw")
-        print("3. PIX Transfer")
-        print("4. Show Account Info")
-        print("5. View Transactions")
-        print("6. Set/Update PIX Key")
-        print("7. Change Credit Limit")
-        print("8. Change Password")
-        print("9. Logout")
-
-        choice = input("Choose option: ")
+        _clear()
+        _pr(_MENU)
+
+        choice = _inp("Choose option: ")
+        if choice == "9":
+            _clear()
+            _pr("Logged out.")
+            break
+        handler = _get(choice)
+        _clear()
+        if handler:
+            handler()
+        else:
+            _pr("Invalid option.")
+        _pause()
+
+def main(_inp=_prompt, _pr=print, _clear=clearScreen, _pause=pause):
+    while 1:
+        _clear()
+        _pr(_MAIN_MENU)
+        choice = _inp("Choose option: ")
         if choice == "1":
-            clearScreen()
-            amount = getFloat("Deposit amount: ")
-            account.deposit(amount)
-            pause()
+            signUp()
+            _pause()
         elif choice == "2":
-            clearScreen()
-            amount = getFloat("Withdraw amount: ")
-            account.withdraw(amount)
-            pause()
+            logIn()
+            _pause()
         elif choice == "3":
-            clearScreen()
-            pix_key = input("Target PIX key: ").strip()
-            amount = getFloat("Transfer amount: ")
-            account.transfer(amount, pix_key)
-            pause()
-        elif choice == "4":
-            clearScreen()
-            print(f"Username: {account.username}")
-            print(f"Agency: {account.agency}")
-            print(f"Balance: {account.balance}")
-            print(f"Credit Used: {account.credit_used}/{account.credit_limit}")
-            print(f"PIX Key: {account.pix_key or 'Not set'}")
-            pause()
-        elif choice == "5":
-            clearScreen()
-            print("--- Transaction Log ---")
-            for t in account.transactions:
-                print(t)
-            pause()
-        elif choice == "6":
-            clearScreen()
-            pix_key = input("Enter new PIX key: ").strip()
-            if not pix_key:
-                clearScreen()
-                print("PIX key cannot be empty.")
-            elif pix_key in pix_registry and pix_registry[pix_key] != account:
-                clearScreen()
-                print("This PIX key is already registered to another account.")
-            else:
-                if account.pix_key:
-                    pix_registry.pop(account.pix_key, None)
-                account.pix_key = pix_key
-                pix_registry[pix_key] = account
-                account.logTransaction("PIX key set/updated.")
-                clearScreen()
-                print("PIX key updated successfully.")
-            pause()
-        elif choice == "7":
-            clearScreen()
-            new_limit = getFloat("New credit limit: ")
-            account.changeCreditLimit(new_limit)
-            pause()
-        elif choice == "8":
-            clearScreen()
-            old_pass = getpass.getpass("Enter current password: ")
-            new_pass = getpass.getpass("Enter new password: ")
-            account.changePass(old_pass, new_pass)
-            pause()
-        elif choice == "9":
-            clearScreen()
-            print("Logged out.")
+            _clear()
+            _pr("Goodbye!")
+            _pause()
             break
         else:
-            clearScreen()
-            print("Invalid option.")
-            pause()
-
-while 1:
-    clearScreen()
-    print("=== Simple Bank App ===")
-    print("1. Register")
-    print("2. Login")
-    print("3. Exit")
-    choice = input("Choose option: ")
-    if choice == "1":
-        signUp()
-        pause()
-    elif choice == "2":
-        logIn()
-        pause()
-    elif choice == "3":
-        clearScreen()
-        print("Goodbye!")
-        pause()
-        break
-    else:
-        clearScreen()
-        print("Invalid choice.")
-        pause()
\ No newline at end of file
+            _clear()
+            _pr("Invalid choice.")
+            _pause()
+
+if __name__ == "__main__":
+    main()
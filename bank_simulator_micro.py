@@ -1,44 +1,125 @@
-import getpass
+import hashlib
+import hmac
 import os
+import re
+import sys
+from sys import intern
+from collections import deque
+from decimal import ROUND_HALF_EVEN, Context, Decimal
 
-_inp = input
 _pr = print
 
-_clear_cmd = 'cls' if os.name == 'nt' else 'clear'
+sys.stdout.reconfigure(line_buffering=False)
+
+_write = sys.stdout.write
+_flush = sys.stdout.flush
+_readline = sys.stdin.readline
+
+if os.name == 'nt':
+    os.system('')
+
+_CLEAR = "\x1b[2J\x1b[H"
+
+_MENU = ("--- Account Menu ---\n"
+         "1. Deposit\n"
+         "2. Withdraw\n"
+         "3. PIX Transfer\n"
+         "4. Show Account Info\n"
+         "5. View Transactions\n"
+         "6. Set/Update PIX Key\n"
+         "7. Change Credit Limit\n"
+         "8. Change Password\n"
+         "9. Logout")
+
+_MAIN_MENU = ("=== Simple Bank App ===\n"
+              "1. Register\n"
+              "2. Login\n"
+              "3. Exit")
 
 def clearScreen():
-    os.system(_clear_cmd)
+    _write(_CLEAR)
+    _flush()
+
+def _prompt(prompt):
+    _write(prompt)
+    _flush()
+    line = _readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+def _getpass(prompt):
+    from getpass import getpass
+    return getpass(prompt)
 
 def pause():
-    _inp("\nPress Enter to continue...")
+    _prompt("\nPress Enter to continue...")
+
+_MAX_AMOUNT = Decimal("999999999999999.99")
+_CENT = Decimal("0.01")
+_MONEY_CTX = Context(prec=20, rounding=ROUND_HALF_EVEN)
+
+_AMOUNT_RE = re.compile(r"[+-]?(?:\d{1,15}(?:\.\d{0,2})?|\.\d{1,2})")
 
-def getFloat(prompt):
+def getAmount(prompt, _match=_AMOUNT_RE.fullmatch):
+    # amounts are kept as integer cents
     while 1:
-        try:
-            return float(_inp(prompt))
-        except ValueError:
-            _pr("Invalid number.")
+        s = _prompt(prompt).strip()
+        if _match(s):
+            amount = Decimal(s)
+            if abs(amount) <= _MAX_AMOUNT:
+                return int(amount.quantize(_CENT, context=_MONEY_CTX).scaleb(2, _MONEY_CTX))
+        _pr("Invalid number.")
+
+def _hash_password(password):
+    return hashlib.sha256(password.encode()).digest()
+
+def _fmt_cents(cents):
+    q, r = divmod(abs(cents), 100)
+    return f"{'-' if cents < 0 else ''}{q}.{r:02d}"
+
+_TX_FORMATS = {
+    "D": lambda amount, balance: f"Deposited {_fmt_cents(amount)}. Balance: {_fmt_cents(balance)}",
+    "W": lambda amount, balance: f"Withdrew {_fmt_cents(amount)}. Balance: {_fmt_cents(balance)}",
+    "C": lambda amount: f"Added {_fmt_cents(amount)} to balance using credit.",
+    "T": lambda amount, name, balance: f"Transferred {_fmt_cents(amount)} to {name}. Balance: {_fmt_cents(balance)}",
+    "R": lambda amount, name, balance: f"Received {_fmt_cents(amount)} from {name}. Balance: {_fmt_cents(balance)}",
+    "L": lambda limit: f"Credit limit updated to {_fmt_cents(limit)}",
+    "P": lambda: "Password changed.",
+    "K": lambda: "PIX key set/updated.",
+}
+
+def _format_tx(record):
+    return _TX_FORMATS[record[0]](*record[1:])
 
 class BankAccount:
+    __slots__ = ('username', 'password', 'agency', 'balance', 'credit_limit',
+                 'credit_used', 'available_credit', 'transactions', 'pix_key')
+
     def __init__(self, username, password, agency):
         self.username = username
-        self.password = password
+        self.password = _hash_password(password)
         self.agency = agency
-        self.balance = 0.0
-        self.credit_limit = 100.0
-        self.credit_used = 0.0
-        self.transactions = []
+        self.balance = 0
+        self.credit_limit = 10000
+        self.credit_used = 0
+        self.available_credit = self.credit_limit
+        self.transactions = deque()
         self.pix_key = None
 
-    def logTransaction(self, msg):
-        self.transactions.append(msg)
+    def logTransaction(self, record):
+        self.transactions.append(record)
+
+    def checkPassword(self, password):
+        return hmac.compare_digest(self.password, _hash_password(password))
 
     def deposit(self, amount):
         clearScreen()
         if amount > 0:
             self.balance += amount
-            msg = f"Deposited {amount}. Balance: {self.balance}"
-            self.logTransaction(msg)
+            record = ("D", amount, self.balance)
+            self.logTransaction(record)
+            msg = _format_tx(record)
         else:
             msg = "Invalid deposit amount."
         _pr(msg)
@@ -49,12 +130,26 @@ class BankAccount:
             _pr("Invalid withdrawal amount.")
         elif amount <= self.balance:
             self.balance -= amount
-            msg = f"Withdrew {amount}. Balance: {self.balance}"
-            self.logTransaction(msg)
-            _pr(msg)
+            record = ("W", amount, self.balance)
+            self.logTransaction(record)
+            _pr(_format_tx(record))
         else:
             _pr("Insufficient funds.")
 
+    def takeCredit(self, amount):
+        clearScreen()
+        if amount <= 0:
+            _pr("Invalid transfer amount.")
+        elif amount <= self.available_credit:
+            self.credit_used += amount
+            self.available_credit -= amount
+            self.balance += amount
+            record = ("C", amount)
+            self.logTransaction(record)
+            _pr(_format_tx(record))
+        else:
+            _pr("Not enough credit available.")
+
     def transfer(self, amount, pix_key):
         clearScreen()
         if not self.pix_key:
@@ -64,185 +159,175 @@ class BankAccount:
             _pr("Invalid transfer amount.")
             return
 
-        if pix_key == self.pix_key:
-            available_credit = self.credit_limit - self.credit_used
-            if amount <= available_credit:
-                self.credit_used += amount
-                self.balance += amount
-                msg = f"Added {amount} to balance using credit."
-                self.logTransaction(msg)
-                _pr(msg)
-            else:
-                _pr("Not enough credit available.")
+        target = by_key.get(("p", pix_key))
+        if not target or not target.pix_key:
+            _pr("Target PIX key not found or not set.")
+            return
+        if amount <= self.balance:
+            self.balance -= amount
+            target.balance += amount
+            self.transactions.append(("T", amount, target.username, self.balance))
+            target.transactions.append(("R", amount, self.username, target.balance))
+            _pr(f"Transferred {_fmt_cents(amount)} to {target.username}.")
         else:
-            target = pix_registry.get(pix_key)
-            if not target or not target.pix_key:
-                _pr("Target PIX key not found or not set.")
-                return
-            if amount <= self.balance:
-                self.balance -= amount
-                target.balance += amount
-                self.logTransaction(f"Transferred {amount} to {target.username}. Balance: {self.balance}")
-                target.logTransaction(f"Received {amount} from {self.username}. Balance: {target.balance}")
-                _pr(f"Transferred {amount} to {target.username}.")
-            else:
-                _pr("Insufficient funds for transfer.")
+            _pr("Insufficient funds for transfer.")
 
     def changeCreditLimit(self, new_limit):
         clearScreen()
         if new_limit >= self.credit_used:
+            self.available_credit += new_limit - self.credit_limit
             self.credit_limit = new_limit
-            msg = f"Credit limit updated to {new_limit}"
-            self.logTransaction(msg)
-            _pr(msg)
+            record = ("L", new_limit)
+            self.logTransaction(record)
+            _pr(_format_tx(record))
         else:
             _pr("New limit cannot be lower than current credit used.")
 
     def changePass(self, old, new):
         clearScreen()
-        if self.password != old:
+        if not self.checkPassword(old):
             _pr("Incorrect current password.")
             return False
         if not new:
             _pr("New password cannot be empty.")
             return False
-        self.password = new
-        self.logTransaction("Password changed.")
+        self.password = _hash_password(new)
+        self.logTransaction(("P",))
         _pr("Password updated successfully.")
         return True
 
-accounts = {}
-pix_registry = {}
+# usernames are keyed as ("u", name), PIX keys as ("p", key)
+by_key = {}
 
 for name in ("user1", "user2"):
     acc = BankAccount(name, "pass", "DF")
-    acc.pix_key = name + "pix"
-    accounts[name] = acc
-    pix_registry[acc.pix_key] = acc
-
-def signUp():
-    clearScreen()
-    username = _inp("Choose username: ")
-    if username in accounts:
-        clearScreen()
+    acc.pix_key = intern(name + "pix")
+    by_key["u", name] = acc
+    by_key["p", acc.pix_key] = acc
+
+def signUp(_inp=_prompt, _pr=_pr, _clear=clearScreen, _pause=pause,
+           _getpass=_getpass):
+    _clear()
+    username = intern(_inp("Choose username: "))
+    if ("u", username) in by_key:
+        _clear()
         _pr("Username already taken.")
         return
 
-    password = getpass.getpass("Enter password: ")
+    password = _getpass("Enter password: ")
     agency = _inp("Enter agency: ")
     if not agency:
-        clearScreen()
+        _clear()
         _pr("Agency is required.")
-        pause()
+        _pause()
         return
 
-    accounts[username] = BankAccount(username, password, agency)
-    clearScreen()
+    by_key["u", username] = BankAccount(username, password, agency)
+    _clear()
     _pr("Account registered successfully!")
 
-def logIn():
-    clearScreen()
-    username = _inp("Enter username: ")
-    password = getpass.getpass("Enter password: ")
-    account = accounts.get(username)
+def logIn(_inp=_prompt, _pr=_pr, _clear=clearScreen, _pause=pause,
+          _getpass=_getpass, _get=by_key.get):
+    _clear()
+    username = intern(_inp("Enter username: "))
+    password = _getpass("Enter password: ")
+    account = _get(("u", username))
 
-    if account and account.password == password:
-        clearScreen()
+    if account and account.checkPassword(password):
+        _clear()
         _pr(f"Welcome, {username}!")
-        pause()
+        _pause()
         accountMenu(account)
     else:
-        clearScreen()
+        _clear()
         _pr("Invalid credentials.")
 
 def showAccountInfo(account):
     _pr(f"Username: {account.username}")
     _pr(f"Agency: {account.agency}")
-    _pr(f"Balance: {account.balance}")
-    _pr(f"Credit Used: {account.credit_used}/{account.credit_limit}")
+    _pr(f"Balance: {_fmt_cents(account.balance)}")
+    _pr(f"Credit Used: {_fmt_cents(account.credit_used)}/{_fmt_cents(account.credit_limit)}")
     _pr(f"PIX Key: {account.pix_key or 'Not set'}")
 
-def accountMenu(account):
+def accountMenu(account, _inp=_prompt, _pr=_pr, _clear=clearScreen, _pause=pause,
+                _getpass=_getpass, _getAmount=getAmount):
+    deposit, withdraw = account.deposit, account.withdraw
+    transfer, takeCredit = account.transfer, account.takeCredit
+    changeCreditLimit, changePass = account.changeCreditLimit, account.changePass
     while 1:
-        clearScreen()
-        _pr("--- Account Menu ---")
-        _pr("1. Deposit")
-        _pr("2. Withdraw")
-        _pr("3. PIX Transfer")
-        _pr("4. Show Account Info")
-        _pr("5. View Transactions")
-        _pr("6. Set/Update PIX Key")
-        _pr("7. Change Credit Limit")
-        _pr("8. Change Password")
-        _pr("9. Logout")
+        _clear()
+        _pr(_MENU)
 
         choice = _inp("Choose option: ")
 
         match choice:
             case "1":
-                amount = getFloat("Deposit amount: ")
-                account.deposit(amount)
+                amount = _getAmount("Deposit amount: ")
+                deposit(amount)
             case "2":
-                amount = getFloat("Withdraw amount: ")
-                account.withdraw(amount)
+                amount = _getAmount("Withdraw amount: ")
+                withdraw(amount)
             case "3":
-                pix_key = _inp("Target PIX key: ").strip()
-                amount = getFloat("Transfer amount: ")
-                account.transfer(amount, pix_key)
+                pix_key = intern(_inp("Target PIX key: ").strip())
+                amount = _getAmount("Transfer amount: ")
+                if pix_key == account.pix_key:
+                    takeCredit(amount)
+                else:
+                    transfer(amount, pix_key)
             case "4":
-                clearScreen()
+                _clear()
                 showAccountInfo(account)
             case "5":
-                clearScreen()
-                _pr("--- Transaction Log ---")
-                _pr(*account.transactions, sep="\n")
+                _clear()
+                _write("\n".join(("--- Transaction Log ---", *map(_format_tx, account.transactions))) + "\n")
             case "6":
-                clearScreen()
-                pix_key = _inp("Enter new PIX key: ").strip()
+                _clear()
+                pix_key = intern(_inp("Enter new PIX key: ").strip())
                 if not pix_key:
                     _pr("PIX key cannot be empty.")
-                elif pix_key in pix_registry and pix_registry[pix_key] != account:
+                elif by_key.get(("p", pix_key), account) != account:
                     _pr("This PIX key is already registered.")
                 else:
                     if account.pix_key:
-                        pix_registry.pop(account.pix_key, None)
+                        by_key.pop(("p", account.pix_key), None)
                     account.pix_key = pix_key
-                    pix_registry[pix_key] = account
-                    account.logTransaction("PIX key set/updated.")
+                    by_key["p", pix_key] = account
+                    account.logTransaction(("K",))
                     _pr("PIX key updated successfully.")
             case "7":
-                new_limit = getFloat("New credit limit: ")
-                account.changeCreditLimit(new_limit)
+                new_limit = _getAmount("New credit limit: ")
+                changeCreditLimit(new_limit)
             case "8":
-                old = getpass.getpass("Enter current password: ")
-                new = getpass.getpass("Enter new password: ")
-                account.changePass(old, new)
+                old = _getpass("Enter current password: ")
+                new = _getpass("Enter new password: ")
+                changePass(old, new)
             case "9":
-                clearScreen()
+                _clear()
                 _pr("Logged out.")
                 break
             case _:
                 _pr("Invalid option.")
-        pause()
-
-while 1:
-    clearScreen()
-    _pr("=== Simple Bank App ===")
-    _pr("1. Register")
-    _pr("2. Login")
-    _pr("3. Exit")
-    choice = _inp("Choose option: ")
-
-    match choice:
-        case "1":
-            signUp()
-        case "2":
-            logIn()
-        case "3":
-            clearScreen()
-            _pr("Goodbye!")
-            pause()
-            break
-        case _:
-            _pr("Invalid choice.")
-    pause()
\ No newline at end of file
+        _pause()
+
+def main(_inp=_prompt, _pr=_pr, _clear=clearScreen, _pause=pause):
+    while 1:
+        _clear()
+        _pr(_MAIN_MENU)
+        choice = _inp("Choose option: ")
+
+        match choice:
+            case "1":
+                signUp()
+            case "2":
+                logIn()
+            case "3":
+                _clear()
+                _pr("Goodbye!")
+                _pause()
+                break
+            case _:
+                _pr("Invalid choice.")
+        _pause()
+
+if __name__ == "__main__":
+    main()